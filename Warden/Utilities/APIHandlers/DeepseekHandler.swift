@@ -118,18 +118,19 @@ class DeepseekHandler: ChatGPTHandler {
         )
     }
     
+    private static let thinkingTagsRegex: NSRegularExpression? = {
+        try? NSRegularExpression(pattern: "<think>\\s*([\\s\\S]*?)\\s*</think>", options: [])
+    }()
+
     private func removeThinkingTags(from content: String) -> String {
-        let pattern = "<think>\\s*([\\s\\S]*?)\\s*</think>"
-        
-        do {
-            let regex = try NSRegularExpression(pattern: pattern, options: [])
-            let range = NSRange(content.startIndex..., in: content)
-            let modifiedString = regex.stringByReplacingMatches(in: content, options: [], range: range, withTemplate: "")
-            
-            return modifiedString.trimmingCharacters(in: .whitespacesAndNewlines)
-        } catch {
-            WardenLog.app.error("Deepseek regex creation error: \(error.localizedDescription, privacy: .public)")
+        guard let regex = Self.thinkingTagsRegex else {
+            WardenLog.app.error("Deepseek regex creation error")
             return content
         }
+
+        let range = NSRange(content.startIndex..., in: content)
+        let modifiedString = regex.stringByReplacingMatches(in: content, options: [], range: range, withTemplate: "")
+
+        return modifiedString.trimmingCharacters(in: .whitespacesAndNewlines)
     }
 }